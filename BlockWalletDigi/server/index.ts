@@ -17,12 +17,6 @@ import { createServer } from "http";
 const app = express();
 const httpServer = createServer(app);
 
-declare module "http" {
-  interface IncomingMessage {
-    rawBody: unknown;
-  }
-}
-
 // Setup shared security
 const allowedOrigins = process.env.ALLOWED_ORIGINS?.split(',') || [
   'http://localhost:5000',
@@ -35,14 +29,9 @@ const allowedOrigins = process.env.ALLOWED_ORIGINS?.split(',') || [
 
 setupSecurity(app, { allowedOrigins });
 
-app.use(
-  express.json({
-    limit: '10mb',
-    verify: (req, _res, buf) => {
-      req.rawBody = buf;
-    },
-  }),
-);
+// Note: no `verify` hook here - it would keep a second full copy of every
+// request body (up to 10mb base64 document scans) alive per request
+app.use(express.json({ limit: '10mb' }));
 
 app.use(express.urlencoded({ extended: false, limit: '10mb' }));
 
@@ -76,6 +65,11 @@ app.use((req, res, next) => {
         logLine += ` :: ${JSON.stringify(capturedJsonResponse)}`;
       }
 
+      // Cap log lines so multi-MB credential payloads don't linger in memory
+      if (logLine.length > 500) {
+        logLine = logLine.slice(0, 499) + "…";
+      }
+
       log(logLine);
     }
   });
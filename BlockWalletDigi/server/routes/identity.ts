@@ -129,12 +129,8 @@ router.post('/liveness/complete', async (req: Request, res: Response) => {
             // Create a completed session for the user
             const session = livenessService.startLivenessSession(userId);
 
-            // Mark all challenges as complete
-            for (const challenge of session.challenges) {
-                livenessService.completeChallenge(session.id, challenge.id);
-            }
-
-            const result = livenessService.getSessionResult(session.id);
+            // Mark all challenges as complete in one pass
+            const result = livenessService.completeAllChallenges(session.id);
 
             // Add AI analysis to result if available
             if (result && aiDetails) {
@@ -169,18 +165,23 @@ router.get('/liveness/:sessionId', async (req: Request, res: Response) => {
     try {
         const { sessionId } = req.params;
 
-        const result = livenessService.getSessionResult(sessionId);
+        // One lookup returns the session together with its challenges, so
+        // in-progress sessions no longer need separate challenge polling
+        const session = livenessService.getLivenessSession(sessionId);
 
-        if (!result) {
+        if (!session) {
             return res.status(404).json({
                 success: false,
-                error: 'Session not found or incomplete'
+                error: 'Session not found'
             });
         }
 
         res.json({
             success: true,
-            result
+            status: session.status,
+            challenges: session.challenges,
+            expiresAt: session.expiresAt,
+            result: session.result ?? null
         });
     } catch (error: any) {
         console.error('Get liveness result error:', error);
@@ -238,6 +238,27 @@ router.post('/wallet/notifications/:id/read', async (req, res) => {
     }
 });
 
+/**
+ * Mark multiple notifications as read in one request
+ */
+router.post('/wallet/notifications/read', async (req, res) => {
+    try {
+        const userId = parseInt(req.body.userId) || 1;
+        const { ids } = req.body;
+
+        if (!Array.isArray(ids) || ids.length === 0) {
+            return res.status(400).json({ error: 'ids array is required' });
+        }
+
+        const updated = await walletService.markNotificationsRead(userId, ids);
+
+        res.json({ success: true, updated });
+    } catch (error) {
+        console.error('Mark notifications error:', error);
+        res.status(500).json({ error: 'Failed to mark notifications' });
+    }
+});
+
 /**
  * Get activity feed
  */
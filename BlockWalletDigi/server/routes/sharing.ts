@@ -110,6 +110,8 @@ router.get('/verify/:token', async (req, res) => {
             ip: req.ip || 'unknown',
             userAgent: req.get('user-agent') || 'unknown',
             organization: req.query.org as string,
+        }, {
+            consume: req.query.consume === 'true',
         });
 
         if (!result.valid) {
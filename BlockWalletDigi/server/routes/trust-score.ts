@@ -178,11 +178,28 @@ import * as livenessService from '../services/liveness-service';
 import * as biometricsService from '../services/biometrics-service';
 import * as documentService from '../services/document-scanner-service';
 
+// Short-lived cache of aggregated trust data; scores change on the order of
+// user actions, not per request, so repeated dashboard hits within the TTL
+// skip the liveness/biometrics/document lookups entirely
+const TRUST_DATA_TTL_MS = 30_000;
+const trustDataCache = new Map<number, { data: UserTrustData; expiresAt: number }>();
+
 /**
  * Build user trust data from storage/database
  * In production, this would query multiple tables
  */
 async function getUserTrustData(userId: number): Promise<UserTrustData> {
+    const cached = trustDataCache.get(userId);
+    if (cached && cached.expiresAt > Date.now()) {
+        return cached.data;
+    }
+
+    const data = await buildUserTrustData(userId);
+    trustDataCache.set(userId, { data, expiresAt: Date.now() + TRUST_DATA_TTL_MS });
+    return data;
+}
+
+async function buildUserTrustData(userId: number): Promise<UserTrustData> {
     // Fetch real status from services
     const livenessStatus = livenessService.getUserLivenessStatus(userId.toString());
     const biometricsStatus = biometricsService.getBiometricStatus(userId.toString());
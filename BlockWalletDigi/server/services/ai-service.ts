@@ -5,6 +5,17 @@ import { GoogleGenerativeAI } from "@google/generative-ai";
 // Note: In a real app, use process.env.GEMINI_API_KEY
 const genAI = new GoogleGenerativeAI(process.env.GEMINI_API_KEY || "YOUR_API_KEY_HERE");
 
+// Cache the model handle - constructing it per request repeats config parsing
+// for no benefit, and the handle is stateless across calls
+let flashModel: ReturnType<typeof genAI.getGenerativeModel> | null = null;
+
+function getFlashModel() {
+    if (!flashModel) {
+        flashModel = genAI.getGenerativeModel({ model: "gemini-1.5-flash" });
+    }
+    return flashModel;
+}
+
 export interface AIAnalysisResult {
     isReal: boolean;
     confidence: number;
@@ -34,7 +45,7 @@ export const aiService = {
                 };
             }
 
-            const model = genAI.getGenerativeModel({ model: "gemini-1.5-flash" });
+            const model = getFlashModel();
 
             // Remove data:image/jpeg;base64, prefix if present
             const base64Data = imageBase64.replace(/^data:image\/\w+;base64,/, "");
@@ -115,7 +126,7 @@ export const aiService = {
                 };
             }
 
-            const model = genAI.getGenerativeModel({ model: "gemini-1.5-flash" });
+            const model = getFlashModel();
             const base64Data = imageBase64.replace(/^data:image\/\w+;base64,/, "");
 
             const prompt = `
@@ -38,6 +38,15 @@ const pendingCredentials = new Map<string, PendingCredential>();
 const credentialsByRecipient = new Map<string, Set<string>>();
 const webhookConfigs = new Map<string, WebhookConfig>(); // walletDid -> config
 
+// Cap each delivery so a hung endpoint can't pin a socket and its pending
+// promise indefinitely; fetch reuses pooled keep-alive connections per host
+const WEBHOOK_TIMEOUT_MS = 10_000;
+
+// Failed deliveries are rescheduled with exponential backoff rather than
+// dropped; retries run off a timer, never on a request path
+const WEBHOOK_MAX_ATTEMPTS = 3;
+const WEBHOOK_RETRY_BASE_MS = 30_000;
+
 /**
  * Generate unique credential offer ID
  */
@@ -89,12 +98,13 @@ export async function pushCredentialToWallet(
     }
     credentialsByRecipient.get(recipientDid)!.add(offerId);
 
-    // Send webhook if configured
+    // Send webhook if configured - don't block the push response on the
+    // recipient's endpoint; delivery failures are already logged internally
     if (options?.sendWebhook !== false) {
-        await sendWebhookNotification(recipientDid, 'credential_offered', {
+        sendWebhookNotification(recipientDid, 'credential_offered', {
             offerId,
             preview: pendingCred.credentialPreview,
-        });
+        }).catch((error) => console.error('[Push] Webhook notification failed:', error));
     }
 
     console.log(`[Push] Credential ${offerId} pushed to ${recipientDid}`);
@@ -230,24 +240,58 @@ async function sendWebhookNotification(
         payload,
     });
 
+    await attemptWebhookDelivery(config, event, body, 1);
+}
+
+/**
+ * Deliver a webhook, rescheduling failed attempts with exponential backoff
+ */
+async function attemptWebhookDelivery(
+    config: WebhookConfig,
+    event: string,
+    body: string,
+    attempt: number
+): Promise<void> {
+    try {
+        await deliverWebhook(config, event, body);
+        console.log(`[Push] Webhook sent to ${config.url} for event ${event}`);
+    } catch (error) {
+        if (attempt >= WEBHOOK_MAX_ATTEMPTS) {
+            console.error(`[Push] Webhook to ${config.url} failed after ${attempt} attempts:`, error);
+            return;
+        }
+
+        const delayMs = WEBHOOK_RETRY_BASE_MS * 2 ** (attempt - 1);
+        console.warn(`[Push] Webhook attempt ${attempt} to ${config.url} failed, retrying in ${delayMs}ms`);
+        setTimeout(() => {
+            attemptWebhookDelivery(config, event, body, attempt + 1)
+                .catch((e) => console.error('[Push] Webhook retry failed:', e));
+        }, delayMs);
+    }
+}
+
+/**
+ * Deliver a signed webhook payload to a configured endpoint
+ */
+async function deliverWebhook(config: WebhookConfig, event: string, body: string): Promise<void> {
     const signature = crypto
         .createHmac('sha256', config.secret)
         .update(body)
         .digest('hex');
 
-    try {
-        await fetch(config.url, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-                'X-CredVerse-Signature': signature,
-                'X-CredVerse-Event': event,
-            },
-            body,
-        });
-        console.log(`[Push] Webhook sent to ${config.url} for event ${event}`);
-    } catch (error) {
-        console.error(`[Push] Webhook failed:`, error);
+    const response = await fetch(config.url, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-CredVerse-Signature': signature,
+            'X-CredVerse-Event': event,
+        },
+        body,
+        signal: AbortSignal.timeout(WEBHOOK_TIMEOUT_MS),
+    });
+
+    if (!response.ok) {
+        throw new Error(`Webhook endpoint responded ${response.status}`);
     }
 }
 
@@ -313,15 +313,28 @@ function runAuthenticityChecks(imageData: string, documentType: string): Documen
  * Calculate overall document score
  */
 function calculateDocumentScore(fields: ExtractedField[], checks: DocumentScanResult['authenticityChecks']): number {
-    // Average field confidence
-    const avgFieldConfidence = fields.reduce((sum, f) => sum + f.confidence, 0) / fields.length;
+    // Aggregate confidences and pass counts in single passes instead of
+    // separate filter/reduce scans per statistic
+    let fieldConfidenceSum = 0;
+    for (const field of fields) {
+        fieldConfidenceSum += field.confidence;
+    }
+    const avgFieldConfidence = fieldConfidenceSum / fields.length;
+
+    let passedCount = 0;
+    let passedConfidenceSum = 0;
+    for (const check of checks) {
+        if (check.passed) {
+            passedCount++;
+            passedConfidenceSum += check.confidence;
+        }
+    }
 
     // Average check confidence (only passed checks)
-    const passedChecks = checks.filter(c => c.passed);
-    const avgCheckConfidence = passedChecks.reduce((sum, c) => sum + c.confidence, 0) / checks.length;
+    const avgCheckConfidence = passedConfidenceSum / checks.length;
 
     // Pass rate
-    const passRate = passedChecks.length / checks.length;
+    const passRate = passedCount / checks.length;
 
     // Weighted score
     const score = (avgFieldConfidence * 40) + (avgCheckConfidence * 30) + (passRate * 30);
@@ -385,12 +398,21 @@ export function getDocumentVerificationStatus(userId: string): {
     documentCount: number;
     types: string[];
 } {
-    const docs = getUserDocuments(userId);
-    const verifiedDocs = docs.filter(d => d.verified);
+    // Single scan over the store instead of materializing the user's document
+    // list and filtering/mapping it again
+    let documentCount = 0;
+    const types: string[] = [];
+
+    for (const doc of scannedDocuments.values()) {
+        if (doc.userId === userId && doc.verified) {
+            documentCount++;
+            types.push(doc.type);
+        }
+    }
 
     return {
-        verified: verifiedDocs.length > 0,
-        documentCount: verifiedDocs.length,
-        types: verifiedDocs.map(d => d.type)
+        verified: documentCount > 0,
+        documentCount,
+        types
     };
 }
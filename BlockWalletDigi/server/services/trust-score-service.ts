@@ -138,15 +138,22 @@ function calculateFeedbackScore(positive: number, negative: number): number {
     return Math.round(ratio * 5);
 }
 
+// Score thresholds in descending order; the first entry whose minimum the
+// score meets wins, with the final 0 entry as the catch-all
+const SCORE_LEVELS: ReadonlyArray<{ min: number; level: TrustScoreBreakdown['level']; levelLabel: string }> = [
+    { min: 95, level: 'outstanding', levelLabel: 'Outstanding' },
+    { min: 85, level: 'excellent', levelLabel: 'Excellent' },
+    { min: 70, level: 'good', levelLabel: 'Good' },
+    { min: 50, level: 'fair', levelLabel: 'Fair' },
+    { min: 0, level: 'poor', levelLabel: 'Poor' },
+];
+
 /**
  * Get score level and label
  */
 function getScoreLevel(score: number): { level: TrustScoreBreakdown['level']; levelLabel: string } {
-    if (score >= 95) return { level: 'outstanding', levelLabel: 'Outstanding' };
-    if (score >= 85) return { level: 'excellent', levelLabel: 'Excellent' };
-    if (score >= 70) return { level: 'good', levelLabel: 'Good' };
-    if (score >= 50) return { level: 'fair', levelLabel: 'Fair' };
-    return { level: 'poor', levelLabel: 'Poor' };
+    const { level, levelLabel } = SCORE_LEVELS.find(entry => score >= entry.min) ?? SCORE_LEVELS[SCORE_LEVELS.length - 1];
+    return { level, levelLabel };
 }
 
 /**
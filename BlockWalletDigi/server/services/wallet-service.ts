@@ -91,6 +91,10 @@ export interface WalletNotification {
 // In-memory wallet storage (production would use encrypted database)
 const wallets = new Map<number, WalletState>();
 
+// Token/id -> owner index so share verification is a single lookup instead of
+// scanning every wallet's share list on each /verify request
+const shareIndex = new Map<string, { userId: number; shareId: string }>();
+
 /**
  * Complete Wallet Service
  */
@@ -162,7 +166,7 @@ export class WalletService {
         wallet.credentials.push(storedCredential);
 
         // Add notification
-        this.addNotification(userId, {
+        this.addNotification(wallet, {
             type: 'credential_received',
             title: 'New Credential Received',
             message: `${credential.issuer} issued you a new ${credential.type[0] || 'credential'}`,
@@ -170,7 +174,7 @@ export class WalletService {
         });
 
         // Simulate blockchain anchoring
-        setTimeout(() => this.simulateAnchor(userId, storedCredential.id), 2000);
+        setTimeout(() => this.simulateAnchor(wallet, storedCredential), 2000);
 
         return storedCredential;
     }
@@ -197,32 +201,35 @@ export class WalletService {
         }
 
         const token = this.generateShareToken();
-        const expiry = new Date(Date.now() + options.expiryMinutes * 60 * 1000);
+        const now = new Date();
+        const expiry = new Date(now.getTime() + options.expiryMinutes * 60 * 1000);
 
         const share: ShareRecord = {
-            id: `share-${Date.now()}-${Math.random().toString(36).slice(2, 8)}`,
+            id: `share-${now.getTime()}-${Math.random().toString(36).slice(2, 8)}`,
             credentialId,
             shareType: options.shareType,
             recipientInfo: options.recipientInfo,
             disclosedFields: options.disclosedFields,
             token,
             expiry,
-            createdAt: new Date(),
+            createdAt: now,
             accessLog: [],
             revoked: false,
         };
 
         wallet.shares.push(share);
+        shareIndex.set(share.id, { userId, shareId: share.id });
+        shareIndex.set(share.token, { userId, shareId: share.id });
 
         // Log consent
         wallet.consentLogs.push({
-            id: `consent-${Date.now()}`,
+            id: this.generateLogId('consent', now),
             credentialId,
             action: 'share',
             disclosedFields: options.disclosedFields,
             recipientName: options.recipientInfo,
             purpose: options.purpose || 'general',
-            timestamp: new Date(),
+            timestamp: now,
         });
 
         return share;
@@ -233,64 +240,85 @@ export class WalletService {
      */
     async accessShare(
         shareId: string,
-        accessInfo: { ip: string; userAgent: string; location?: string; organization?: string }
+        accessInfo: { ip: string; userAgent: string; location?: string; organization?: string },
+        options?: { consume?: boolean }
     ): Promise<{ valid: boolean; credential?: Partial<StoredCredential>; error?: string }> {
-        // Find share across all wallets
-        for (const [userId, wallet] of Array.from(wallets.entries())) {
-            const share = wallet.shares.find((s: ShareRecord) => s.id === shareId || s.token === shareId);
+        // Resolve token/id via the index - O(1) instead of scanning every wallet
+        const indexEntry = shareIndex.get(shareId);
+        if (!indexEntry) {
+            return { valid: false, error: 'Share not found' };
+        }
 
-            if (share) {
-                if (share.revoked) {
-                    return { valid: false, error: 'Share has been revoked' };
-                }
+        const wallet = wallets.get(indexEntry.userId);
+        const share = wallet?.shares.find((s: ShareRecord) => s.id === indexEntry.shareId);
+        if (!wallet || !share) {
+            return { valid: false, error: 'Share not found' };
+        }
 
-                if (new Date() > share.expiry) {
-                    return { valid: false, error: 'Share has expired' };
-                }
+        if (share.revoked) {
+            return { valid: false, error: 'Share has been revoked' };
+        }
 
-                // Log access
-                share.accessLog.push({
-                    timestamp: new Date(),
-                    ip: accessInfo.ip,
-                    userAgent: accessInfo.userAgent,
-                    location: accessInfo.location,
-                    organization: accessInfo.organization,
-                    verified: true,
-                });
-
-                // Get credential with selective disclosure
-                const credential = wallet.credentials.find((c: StoredCredential) => c.id === share.credentialId);
-                if (!credential) {
-                    return { valid: false, error: 'Credential not found' };
-                }
+        // One timestamp per access - expiry check, access log and consent log
+        // all see the same instant
+        const now = new Date();
+        if (now > share.expiry) {
+            return { valid: false, error: 'Share has expired' };
+        }
 
-                // Apply selective disclosure
-                const disclosedData = this.applySelectiveDisclosure(credential.data, share.disclosedFields);
-
-                // Notify wallet owner
-                this.addNotification(userId, {
-                    type: 'share_access',
-                    title: 'Credential Accessed',
-                    message: `Your ${credential.type[0]} was verified${accessInfo.organization ? ` by ${accessInfo.organization}` : ''}`,
-                    data: { shareId, accessInfo },
-                });
-
-                return {
-                    valid: true,
-                    credential: {
-                        id: credential.id,
-                        type: credential.type,
-                        issuer: credential.issuer,
-                        issuanceDate: credential.issuanceDate,
-                        data: disclosedData,
-                        anchorStatus: credential.anchorStatus,
-                        hash: credential.hash,
-                    },
-                };
-            }
+        // Log access
+        share.accessLog.push({
+            timestamp: now,
+            ip: accessInfo.ip,
+            userAgent: accessInfo.userAgent,
+            location: accessInfo.location,
+            organization: accessInfo.organization,
+            verified: true,
+        });
+
+        // Get credential with selective disclosure
+        const credential = wallet.credentials.find((c: StoredCredential) => c.id === share.credentialId);
+        if (!credential) {
+            return { valid: false, error: 'Credential not found' };
         }
 
-        return { valid: false, error: 'Share not found' };
+        // Apply selective disclosure
+        const disclosedData = this.applySelectiveDisclosure(credential.data, share.disclosedFields);
+
+        // One-shot shares: retire the token in the same operation as the read
+        // so a second verification attempt cannot reuse it
+        if (options?.consume) {
+            share.revoked = true;
+            wallet.consentLogs.push({
+                id: this.generateLogId('consent', now),
+                credentialId: share.credentialId,
+                action: 'revoke',
+                disclosedFields: share.disclosedFields,
+                purpose: 'share_consumed',
+                timestamp: now,
+            });
+        }
+
+        // Notify wallet owner
+        this.addNotification(wallet, {
+            type: 'share_access',
+            title: 'Credential Accessed',
+            message: `Your ${credential.type[0]} was verified${accessInfo.organization ? ` by ${accessInfo.organization}` : ''}`,
+            data: { shareId, accessInfo },
+        });
+
+        return {
+            valid: true,
+            credential: {
+                id: credential.id,
+                type: credential.type,
+                issuer: credential.issuer,
+                issuanceDate: credential.issuanceDate,
+                data: disclosedData,
+                anchorStatus: credential.anchorStatus,
+                hash: credential.hash,
+            },
+        };
     }
 
     /**
@@ -303,13 +331,14 @@ export class WalletService {
         if (share) {
             share.revoked = true;
 
+            const now = new Date();
             wallet.consentLogs.push({
-                id: `consent-${Date.now()}`,
+                id: this.generateLogId('consent', now),
                 credentialId: share.credentialId,
                 action: 'revoke',
                 disclosedFields: share.disclosedFields,
                 purpose: 'share_revoked',
-                timestamp: new Date(),
+                timestamp: now,
             });
 
             return true;
@@ -375,6 +404,25 @@ export class WalletService {
         }
     }
 
+    /**
+     * Mark several notifications as read in one pass
+     * Avoids one full list scan per notification when a client clears its inbox
+     */
+    async markNotificationsRead(userId: number, notificationIds: string[]): Promise<number> {
+        const wallet = await this.getOrCreateWallet(userId);
+        const ids = new Set(notificationIds);
+        let updated = 0;
+
+        for (const notification of wallet.notifications) {
+            if (!notification.read && ids.has(notification.id)) {
+                notification.read = true;
+                updated++;
+            }
+        }
+
+        return updated;
+    }
+
     /**
      * Create wallet backup
      */
@@ -433,8 +481,14 @@ export class WalletService {
             byCategory[cred.category] = (byCategory[cred.category] || 0) + 1;
         }
 
-        const activeShares = wallet.shares.filter(s => !s.revoked && new Date() < s.expiry).length;
-        const totalVerifications = wallet.shares.reduce((sum, s) => sum + s.accessLog.length, 0);
+        // Aggregate share counters in a single pass instead of one scan per stat
+        const now = new Date();
+        let activeShares = 0;
+        let totalVerifications = 0;
+        for (const share of wallet.shares) {
+            if (!share.revoked && now < share.expiry) activeShares++;
+            totalVerifications += share.accessLog.length;
+        }
 
         return {
             totalCredentials: wallet.credentials.length,
@@ -481,6 +535,12 @@ export class WalletService {
         return crypto.randomBytes(32).toString('base64url');
     }
 
+    private generateLogId(prefix: string, now: Date): string {
+        // Random suffix keeps ids unique when several entries land in the
+        // same millisecond
+        return `${prefix}-${now.getTime()}-${Math.random().toString(36).slice(2, 8)}`;
+    }
+
     private applySelectiveDisclosure(data: any, disclosedFields: string[]): any {
         if (disclosedFields.length === 0) return data;
 
@@ -507,35 +567,29 @@ export class WalletService {
         return result;
     }
 
-    private addNotification(userId: number, notification: Omit<WalletNotification, 'id' | 'timestamp' | 'read'>) {
-        const wallet = wallets.get(userId);
-        if (wallet) {
-            wallet.notifications.push({
-                ...notification,
-                id: `notif-${Date.now()}`,
-                timestamp: new Date(),
-                read: false,
-            });
-        }
+    // Callers already hold the wallet (and credential) objects; taking them
+    // directly avoids re-resolving entries that are plain in-memory references
+    private addNotification(wallet: WalletState, notification: Omit<WalletNotification, 'id' | 'timestamp' | 'read'>) {
+        const now = new Date();
+        wallet.notifications.push({
+            ...notification,
+            id: this.generateLogId('notif', now),
+            timestamp: now,
+            read: false,
+        });
     }
 
-    private async simulateAnchor(userId: number, credentialId: string) {
-        const wallet = wallets.get(userId);
-        if (wallet) {
-            const credential = wallet.credentials.find(c => c.id === credentialId);
-            if (credential) {
-                credential.anchorStatus = 'anchored';
-                credential.anchorTxHash = `0x${crypto.randomBytes(32).toString('hex')}`;
-                credential.blockNumber = Math.floor(Math.random() * 1000000) + 50000000;
-
-                this.addNotification(userId, {
-                    type: 'credential_received',
-                    title: 'Credential Anchored',
-                    message: `Your credential has been anchored to the blockchain`,
-                    data: { credentialId, txHash: credential.anchorTxHash },
-                });
-            }
-        }
+    private async simulateAnchor(wallet: WalletState, credential: StoredCredential) {
+        credential.anchorStatus = 'anchored';
+        credential.anchorTxHash = `0x${crypto.randomBytes(32).toString('hex')}`;
+        credential.blockNumber = Math.floor(Math.random() * 1000000) + 50000000;
+
+        this.addNotification(wallet, {
+            type: 'credential_received',
+            title: 'Credential Anchored',
+            message: `Your credential has been anchored to the blockchain`,
+            data: { credentialId: credential.id, txHash: credential.anchorTxHash },
+        });
     }
 }
 
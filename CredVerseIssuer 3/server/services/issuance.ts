@@ -4,6 +4,9 @@ import { blockchainService } from "./blockchain-service";
 import { signVcJwt, getIssuerPublicKey } from "./vc-signer";
 import { randomUUID } from "crypto";
 
+// In-memory bulk fallback: issue this many credentials concurrently per batch.
+// Tiny jobs run in a single batch, so they behave like the old sequential path.
+const BULK_BATCH_SIZE = 10;
 
 export class IssuanceService {
     // In-memory offer storage (token -> credentialId)
@@ -60,9 +63,10 @@ export class IssuanceService {
             revoked: false,
         });
 
-        // Anchor credential hash on blockchain
-        console.log(`[Issuance] Anchoring credential ${credential.id} on blockchain...`);
-        const anchorResult = await blockchainService.anchorCredential({
+        // Anchor credential hash on blockchain in the background - the chain
+        // write is the slow leg and the credential row is already persisted,
+        // so the issuance response doesn't wait on block confirmation
+        this.anchorCredentialInBackground(credential.id, {
             id: credential.id,
             issuer: vcPayload.iss,
             subject: recipient.did || recipient.studentId,
@@ -70,18 +74,6 @@ export class IssuanceService {
             issuedAt: new Date().toISOString(),
         });
 
-        if (anchorResult.success) {
-            console.log(`[Issuance] Credential ${credential.id} anchored: ${anchorResult.txHash}`);
-            // Update credential with blockchain info
-            await storage.updateCredentialBlockchain(credential.id, {
-                txHash: anchorResult.txHash,
-                blockNumber: anchorResult.blockNumber,
-                credentialHash: anchorResult.hash,
-            });
-        } else {
-            console.warn(`[Issuance] Blockchain anchor failed for ${credential.id}: ${anchorResult.error}`);
-        }
-
         // Webhook Notification
         if (recipient.webhookUrl) {
             console.log(`[Issuance] Sending webhook to ${recipient.webhookUrl}`);
@@ -93,24 +85,23 @@ export class IssuanceService {
                     credentialId: credential.id,
                     vcJwt,
                     recipient: recipient.did || recipient.email
-                })
+                }),
+                signal: AbortSignal.timeout(10_000)
             }).catch(e => console.error("[Issuance] Webhook failed:", e));
         }
 
-        // Email Notification
+        // Email Notification - fire-and-forget like the webhook above so a slow
+        // email provider does not hold up the issuance response
         if (recipient.email) {
-            try {
-                const { emailService } = await import('./email');
-                await emailService.sendCredentialNotification({
+            import('./email')
+                .then(({ emailService }) => emailService.sendCredentialNotification({
                     to: recipient.email,
                     recipientName: recipient.name || 'Student',
                     credentialType: template.name,
                     issuerName: issuer.name,
                     viewLink: `${process.env.APP_URL || 'http://localhost:5002'}/credential/${credential.id}`
-                });
-            } catch (e) {
-                console.error("[Issuance] Email notification failed:", e);
-            }
+                }))
+                .catch(e => console.error("[Issuance] Email notification failed:", e));
         }
 
         // Log the issuance activity
@@ -123,7 +114,6 @@ export class IssuanceService {
                 credentialId: credential.id,
                 templateName: template.name,
                 recipientName: recipient.name,
-                txHash: anchorResult.txHash,
                 webhookSent: !!recipient.webhookUrl
             },
         });
@@ -131,6 +121,32 @@ export class IssuanceService {
         return credential;
     }
 
+    /**
+     * Anchor a credential hash on-chain without holding up the issuance
+     * response; the credential row is updated once the transaction lands
+     */
+    private anchorCredentialInBackground(
+        credentialId: string,
+        payload: { id: string; issuer: string; subject: string; data: any; issuedAt: string }
+    ): void {
+        console.log(`[Issuance] Anchoring credential ${credentialId} on blockchain...`);
+        blockchainService.anchorCredential(payload)
+            .then(async (anchorResult) => {
+                if (anchorResult.success) {
+                    console.log(`[Issuance] Credential ${credentialId} anchored: ${anchorResult.txHash}`);
+                    // Update credential with blockchain info
+                    await storage.updateCredentialBlockchain(credentialId, {
+                        txHash: anchorResult.txHash,
+                        blockNumber: anchorResult.blockNumber,
+                        credentialHash: anchorResult.hash,
+                    });
+                } else {
+                    console.warn(`[Issuance] Blockchain anchor failed for ${credentialId}: ${anchorResult.error}`);
+                }
+            })
+            .catch((e) => console.error(`[Issuance] Blockchain anchor failed for ${credentialId}:`, e));
+    }
+
     createOffer(credentialId: string): string {
         const token = randomUUID();
         this.offers.set(token, credentialId);
@@ -179,19 +195,27 @@ export class IssuanceService {
             let success = 0;
             let failed = 0;
 
-            for (const item of recipientsData) {
-                try {
-                    await this.issueCredential(
+            // Issue in parallel batches - issuance is network-bound (blockchain
+            // anchor + notifications), so overlapping requests cuts wall time
+            for (let i = 0; i < recipientsData.length; i += BULK_BATCH_SIZE) {
+                const batch = recipientsData.slice(i, i + BULK_BATCH_SIZE);
+                const outcomes = await Promise.allSettled(
+                    batch.map(item => this.issueCredential(
                         tenantId,
                         templateId,
                         issuerId,
                         item.recipient,
                         item.data
-                    );
-                    success++;
-                } catch (e) {
-                    console.error(`[Issuance] Bulk job ${jobId} failed for recipient:`, e);
-                    failed++;
+                    ))
+                );
+
+                for (const outcome of outcomes) {
+                    if (outcome.status === 'fulfilled') {
+                        success++;
+                    } else {
+                        console.error(`[Issuance] Bulk job ${jobId} failed for recipient:`, outcome.reason);
+                        failed++;
+                    }
                 }
             }
 
@@ -135,6 +135,7 @@ export function startIssuanceWorker(
             jobResults.set(jobId, result);
 
             // Process each credential
+            let lastReportedProgress = -1;
             for (let i = 0; i < recipients.length; i++) {
                 const { recipient, data } = recipients[i];
 
@@ -149,8 +150,14 @@ export function startIssuanceWorker(
 
                 result.processed++;
 
-                // Update job progress
-                await job.updateProgress(Math.round((result.processed / result.total) * 100));
+                // Update job progress only when the percentage actually moves -
+                // updateProgress is a Redis round trip, and large jobs were
+                // paying one per credential
+                const progress = Math.round((result.processed / result.total) * 100);
+                if (progress !== lastReportedProgress) {
+                    await job.updateProgress(progress);
+                    lastReportedProgress = progress;
+                }
             }
 
             result.status = 'completed';
@@ -123,8 +123,19 @@ export class VerificationEngine {
                 return this.createFailedResult(verificationId, 'Could not parse credential');
             }
 
+            // Checks 1-6 are independent of each other, so run the slow ones
+            // (issuer registry, revocation API, on-chain anchor) concurrently
+            // instead of paying each network round trip in sequence
+            const [signatureCheck, issuerCheck, revocationCheck, anchorCheck, didCheck] = await Promise.all([
+                this.verifySignature(credential),
+                this.verifyIssuer(credential),
+                this.checkRevocation(credential),
+                this.checkOnChainAnchor(credential),
+                this.resolveDID(credential),
+            ]);
+            const expirationCheck = this.checkExpiration(credential);
+
             // Check 1: Signature Validation
-            const signatureCheck = await this.verifySignature(credential);
             checks.push(signatureCheck);
             if (signatureCheck.status === 'failed') {
                 overallStatus = 'failed';
@@ -132,7 +143,6 @@ export class VerificationEngine {
             }
 
             // Check 2: Issuer Verification
-            const issuerCheck = await this.verifyIssuer(credential);
             checks.push(issuerCheck);
             if (issuerCheck.status === 'failed') {
                 overallStatus = 'suspicious';
@@ -142,7 +152,6 @@ export class VerificationEngine {
             }
 
             // Check 3: Expiration Check
-            const expirationCheck = this.checkExpiration(credential);
             checks.push(expirationCheck);
             if (expirationCheck.status === 'failed') {
                 overallStatus = 'failed';
@@ -150,7 +159,6 @@ export class VerificationEngine {
             }
 
             // Check 4: Revocation Check
-            const revocationCheck = await this.checkRevocation(credential);
             checks.push(revocationCheck);
             if (revocationCheck.status === 'failed') {
                 overallStatus = 'failed';
@@ -158,14 +166,12 @@ export class VerificationEngine {
             }
 
             // Check 5: On-chain Anchor Check
-            const anchorCheck = await this.checkOnChainAnchor(credential);
             checks.push(anchorCheck);
             if (anchorCheck.status === 'warning') {
                 riskFlags.push('NO_BLOCKCHAIN_ANCHOR');
             }
 
             // Check 6: DID Document Resolution
-            const didCheck = await this.resolveDID(credential);
             checks.push(didCheck);
             if (didCheck.status === 'failed') {
                 if (overallStatus !== 'failed') overallStatus = 'suspicious';